@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+활동 포인트 집계 배치
+- activity_points 내보내기(CSV)를 읽어 사용자별 총점, 활동 유형별 포인트/횟수 계산
+- 뱃지 자격(badge_definitions 의 id) 계산
+- 체크포인트 이후의 새 행만 처리하고, 아직 DB 에 반영되지 않은 사용자를
+  user_point_summary 테이블 upsert SQL 로 출력 (테이블 정의: supabase_point_summary.sql)
+
+SQL 파일마다 배치 id 가 붙고(파일 첫 줄), 변경된 사용자는 그 배치를
+반영 완료로 표시(--mark-applied 배치id)할 때까지 상태 파일에 남아 이후
+실행의 SQL 에도 계속 포함되므로, SQL 파일을 적용하기 전에 배치가 여러 번
+실행되어도 누락되지 않습니다. 적용한 배치 이후에 다시 변경된 사용자는
+반영 완료로 표시되지 않습니다.
+포인트 내역이 삭제되거나 수정된 경우에는 --full 로 전체를 다시 집계하세요.
+(내역이 모두 삭제된 사용자는 user_point_summary 에서 DELETE 합니다.)
+
+    python scripts/cli.py aggregate-points --ledger activity_points.csv
+    (생성된 SQL 적용 후, 출력된 배치 id 로)
+    python scripts/cli.py aggregate-points --mark-applied 20250101T000000000000Z
+"""
+import os
+import csv
+import sys
+import json
+from datetime import datetime, timezone
+from sql_utils import escape_sql
+
+# 자동 부여 가능한 뱃지 조건: 활동 유형별 최소 횟수 (total_points 는 최소 총점)
+# 나머지 뱃지는 관리자가 직접 부여 (BadgeManager)
+DEFAULT_BADGE_RULES = {
+    "first-step": {"post_create": 1},
+    "hot-learner": {"post_create": 10},
+    "inssa-inspirer": {"comment_create": 30},
+}
+
+def parse_timestamp(value):
+    """Supabase 내보내기 시각 문자열을 UTC datetime 으로 변환"""
+    ts = datetime.fromisoformat(value.strip())
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+def format_timestamp(ts):
+    # 자릿수를 고정해 문자열 비교로 시각 순서를 비교할 수 있게 함
+    return ts.isoformat(timespec="microseconds")
+
+def empty_state():
+    return {"checkpoint_at": None, "checkpoint_ids": [], "users": {}, "pending_users": {}, "batches": []}
+
+def new_batch_id():
+    # 생성 순서대로 문자열 비교가 되도록 고정 자릿수 UTC 시각 사용
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+def load_state(path):
+    """집계 상태(체크포인트 + 사용자별 누적값 + 미반영 사용자/배치) 읽기
+
+    pending_users 는 {user_id: 현재 값이 처음 담긴 배치 id}, batches 는 아직
+    반영 완료로 표시되지 않은 배치 id 목록입니다.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return empty_state()
+    state.setdefault("pending_users", {})
+    state.setdefault("batches", [])
+    return state
+
+def save_state(path, state):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+def read_ledger(path):
+    """activity_points CSV 내보내기를 한 행씩 읽기"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+def aggregate(rows, state):
+    """체크포인트 이후의 행을 상태에 누적하고 변경된 user_id 집합 반환
+
+    같은 시각의 행이 여러 번에 나뉘어 내보내질 수 있으므로 체크포인트
+    시각의 행 id 도 함께 기록해 중복 집계를 막습니다.
+    """
+    checkpoint = parse_timestamp(state["checkpoint_at"]) if state["checkpoint_at"] else None
+    checkpoint_ids = set(state["checkpoint_ids"])
+    latest, latest_ids = checkpoint, set(checkpoint_ids)
+    users = state["users"]
+    changed = set()
+    processed = 0
+
+    for row in rows:
+        created_at = parse_timestamp(row["created_at"])
+        if checkpoint and (created_at < checkpoint or (created_at == checkpoint and row["id"] in checkpoint_ids)):
+            continue
+
+        user_id = row["user_id"]
+        points = int(row["points"])
+        activity_type = row["activity_type"]
+
+        user = users.get(user_id)
+        if user is None:
+            user = users[user_id] = {"total_points": 0, "activity_count": 0, "points_by_type": {}, "counts_by_type": {}, "last_activity_at": None}
+        user["total_points"] += points
+        user["activity_count"] += 1
+        user["points_by_type"][activity_type] = user["points_by_type"].get(activity_type, 0) + points
+        user["counts_by_type"][activity_type] = user["counts_by_type"].get(activity_type, 0) + 1
+        created_at_text = format_timestamp(created_at)
+        if user["last_activity_at"] is None or created_at_text > user["last_activity_at"]:
+            user["last_activity_at"] = created_at_text
+        changed.add(user_id)
+        processed += 1
+
+        if latest is None or created_at > latest:
+            latest, latest_ids = created_at, {row["id"]}
+        elif created_at == latest:
+            latest_ids.add(row["id"])
+
+    state["checkpoint_at"] = format_timestamp(latest) if latest else None
+    state["checkpoint_ids"] = sorted(latest_ids)
+    return changed, processed
+
+def eligible_badges(user, rules):
+    """사용자가 조건을 만족하는 뱃지 id 목록"""
+    badges = []
+    for badge_id, conditions in rules.items():
+        if all(
+            (user["total_points"] if key == "total_points" else user["counts_by_type"].get(key, 0)) >= minimum
+            for key, minimum in conditions.items()
+        ):
+            badges.append(badge_id)
+    return sorted(badges)
+
+def summary_rows(state, user_ids, rules):
+    """user_point_summary 테이블 행 목록"""
+    rows = []
+    for user_id in sorted(user_ids):
+        user = state["users"][user_id]
+        rows.append({
+            "user_id": user_id,
+            "total_points": user["total_points"],
+            "activity_count": user["activity_count"],
+            "points_by_type": user["points_by_type"],
+            "counts_by_type": user["counts_by_type"],
+            "eligible_badges": eligible_badges(user, rules),
+            "last_activity_at": user["last_activity_at"],
+        })
+    return rows
+
+def row_to_values(row):
+    badges = ",".join(escape_sql(badge) for badge in row["eligible_badges"])
+    return (
+        f"  ({escape_sql(row['user_id'])}, {row['total_points']}, {row['activity_count']}, "
+        f"{escape_sql(json.dumps(row['points_by_type'], ensure_ascii=False, sort_keys=True))}::jsonb, "
+        f"{escape_sql(json.dumps(row['counts_by_type'], ensure_ascii=False, sort_keys=True))}::jsonb, "
+        f"ARRAY[{badges}]::text[], {escape_sql(row['last_activity_at'])}, now())"
+    )
+
+def generate_upsert_sql(rows, batch_size=500, batch_id=None, removed_user_ids=()):
+    """batch_size 행 단위의 다중 행 INSERT ... ON CONFLICT 문 (+ 집계에서 빠진 사용자 DELETE 문) 목록 생성"""
+    sql_statements = []
+    if batch_id:
+        sql_statements.append(f"-- batch: {batch_id}\n")
+    sql_statements.append("-- Upsert into user_point_summary table\n")
+    sql_statements.append("BEGIN;\n\n")
+
+    for start in range(0, len(rows), batch_size):
+        values = ",\n".join(row_to_values(row) for row in rows[start:start + batch_size])
+        sql_statements.append(f"""INSERT INTO user_point_summary (
+  user_id, total_points, activity_count, points_by_type, counts_by_type,
+  eligible_badges, last_activity_at, updated_at
+) VALUES
+{values}
+ON CONFLICT (user_id) DO UPDATE SET
+  total_points = EXCLUDED.total_points,
+  activity_count = EXCLUDED.activity_count,
+  points_by_type = EXCLUDED.points_by_type,
+  counts_by_type = EXCLUDED.counts_by_type,
+  eligible_badges = EXCLUDED.eligible_badges,
+  last_activity_at = EXCLUDED.last_activity_at,
+  updated_at = EXCLUDED.updated_at;\n\n""")
+
+    removed_user_ids = sorted(removed_user_ids)
+    for start in range(0, len(removed_user_ids), batch_size):
+        user_ids = ", ".join(escape_sql(user_id) for user_id in removed_user_ids[start:start + batch_size])
+        sql_statements.append(f"DELETE FROM user_point_summary WHERE user_id IN ({user_ids});\n\n")
+
+    sql_statements.append("COMMIT;\n")
+    return sql_statements
+
+def load_rules(path):
+    if not path:
+        return DEFAULT_BADGE_RULES
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def mark_applied(state_path, batch_id):
+    """배치 SQL 적용 완료 표시 - 그 배치에 현재 값이 담긴 사용자만 미반영 목록에서 제거"""
+    state = load_state(state_path)
+    if batch_id not in state["batches"]:
+        print(f"반영 대기 중인 배치가 아닙니다: {batch_id} (대기 중: {', '.join(state['batches']) or '없음'})", file=sys.stderr)
+        return 1
+
+    # 이 배치 이후에 다시 변경된 사용자는 이 배치의 SQL 에 최신 값이 없으므로 남겨 둠
+    # (배치는 그 시점의 미반영 사용자를 모두 포함하므로 이전 배치도 함께 정리됨)
+    pending = state["pending_users"]
+    applied = [user_id for user_id, since in pending.items() if since <= batch_id]
+    for user_id in applied:
+        del pending[user_id]
+    state["batches"] = [batch for batch in state["batches"] if batch > batch_id]
+    save_state(state_path, state)
+    print(f"배치 {batch_id}: 사용자 {len(applied)}명을 반영 완료로 표시했습니다 (남은 미반영 사용자 {len(pending)}명).")
+    return 0
+
+def run_cli(args):
+    """cli.py aggregate-points 서브커맨드"""
+    if args.mark_applied:
+        return mark_applied(args.state, args.mark_applied)
+
+    if not args.ledger:
+        print("포인트 내역 CSV 경로를 지정하세요: --ledger 또는 POINTS_LEDGER_CSV 환경 변수", file=sys.stderr)
+        return 1
+
+    state = load_state(args.state)
+    previous_users = state["users"]
+    if args.full:
+        # 누적값만 다시 계산하고 미반영 사용자/배치 기록은 유지
+        state = dict(empty_state(), pending_users=state["pending_users"], batches=state["batches"])
+    rules = load_rules(args.rules)
+
+    changed, processed = aggregate(read_ledger(args.ledger), state)
+    print(f"새 포인트 내역 {processed}건 처리, 변경된 사용자 {len(changed)}명", file=sys.stderr)
+
+    # 이전 실행에서 생성했지만 아직 반영되지 않은 사용자도 함께 출력
+    # (뱃지 조건이 바뀌었을 수 있으므로 --full 이면 모든 사용자)
+    batch_id = new_batch_id()
+    pending = state["pending_users"]
+    for user_id in (state["users"] if args.full else changed):
+        pending[user_id] = batch_id
+    if args.full:
+        # 내역이 모두 삭제되어 다시 집계한 상태에서 빠진 사용자는 이전 합계가 남지 않도록 DELETE
+        for user_id in set(previous_users) - set(state["users"]):
+            pending[user_id] = batch_id
+    rows = summary_rows(state, [user_id for user_id in pending if user_id in state["users"]], rules)
+    removed = [user_id for user_id in pending if user_id not in state["users"]]
+    if rows or removed:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.writelines(generate_upsert_sql(rows, args.batch_size, batch_id, removed))
+        state["batches"].append(batch_id)
+        print(f"SQL 파일이 생성되었습니다: {args.output} (배치 {batch_id}, {len(rows)}명, 삭제 {len(removed)}명, 이번 실행에서 변경 {len(changed)}명)")
+        print(f"SQL 을 적용한 뒤 --mark-applied {batch_id} 로 반영 완료를 표시하세요.")
+    else:
+        print("변경된 사용자가 없습니다.")
+
+    save_state(args.state, state)
+    return 0
+
+if __name__ == "__main__":
+    from cli import main
+    main(["aggregate-points", *sys.argv[1:]])
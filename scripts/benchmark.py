@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Python 데이터 처리 경로 벤치마크
+- 이미지 마스크 연산 (remove_background*.py, edit_okman.py): 메가픽셀/초
+- 명단 CSV 읽기 + SQL 생성 (import_first_engineer.py): 행/초
+- 수집 항목 후처리 (case_records.process_collected_items): 항목/초
+- 활동 포인트 집계 (aggregate_points.aggregate): 행/초
+- 각 경로의 최대 메모리 사용량 (tracemalloc)
+
+사용법:
+    python scripts/benchmark.py run                 # 실행 후 이력 파일에 추가
+    python scripts/benchmark.py run --only image    # 이름에 image 가 포함된 경로만 (--save 없으면 저장 안 함)
+    python scripts/benchmark.py compare             # 최근 두 실행 비교 (회귀/누락 시 종료 코드 1)
+    python scripts/benchmark.py compare --threshold 10 --baseline 0
+"""
+import os
+import sys
+import json
+import time
+import io
+import csv
+import random
+import argparse
+import platform
+import tracemalloc
+import contextlib
+import subprocess
+from datetime import datetime
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+HISTORY_PATH = os.path.join(SCRIPTS_DIR, "benchmark_history.json")
+
+IMAGE_SIZES = [(256, 256), (1024, 1024), (2048, 2048)]
+ROSTER_SIZES = [1000, 10000, 50000]
+ITEM_SIZES = [1000, 10000, 50000]
+LEDGER_SIZES = [10000, 100000, 500000]
+
+def synthetic_image(width, height, seed=0):
+    """오렌지/흰색 배경 위에 임의 색상 영역이 있는 RGBA 배열 생성"""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    data = np.empty((height, width, 4), dtype=np.uint8)
+    data[:, :] = (245, 160, 60, 255)  # 오렌지 배경
+    data[: height // 5, :, :3] = 250  # 상단 흰색 영역
+    # 중앙의 전경 영역은 임의 색상
+    y0, y1, x0, x1 = height // 4, height * 3 // 4, width // 4, width * 3 // 4
+    data[y0:y1, x0:x1, :3] = rng.integers(0, 256, size=(y1 - y0, x1 - x0, 3), dtype=np.uint8)
+    return data
+
+def synthetic_roster(count, seed=0):
+    """import_first_engineer.py 형식(18개 컬럼)의 명단 행 생성"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        rows.append([
+            str(i + 1), f"{rng.randint(10000000, 99999999)}", f"홍길동{i}", rng.choice(["남", "여"]),
+            "OK저축은행", "디지털본부", "AI추진부", "데이터팀", "AI혁신팀",
+            rng.choice(["사원", "대리", "과장", "차장"]), rng.choice(["팀원", "팀장", ""]),
+            "OK금융그룹", "AI교육센터", "교육생",
+            str(rng.randint(1, count)), str(rng.randint(1, 100)) if i % 7 else "",
+            rng.choice(["우수", "수료", "O'Neil's"]), str(rng.randint(1, 3)),
+        ])
+    return rows
+
+def roster_csv(rows):
+    """명단 행을 헤더 2줄이 있는 CSV 텍스트(StringIO)로 변환"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["명단"])
+    writer.writerow(["no", "employee_id", "name"])
+    writer.writerows(rows)
+    buffer.seek(0)
+    return buffer
+
+def synthetic_items(count, seed=0):
+    """collect_cases() 의 JavaScript 가 반환하는 형식의 항목 목록 생성"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        kind = i % 5
+        items.append({
+            "title": "" if kind == 0 else f"AI 활용 사례 {i} " + "제목" * rng.randint(1, 150),
+            "content": "짧음" if kind == 0 else "내용 " * rng.randint(0, 1500),
+            "url": "https://ok-hrd-edu-ai1.lovable.app/admin" if kind == 1 else f"https://ok-hrd-edu-ai1.lovable.app/post/{i}",
+        })
+    return items
+
+def synthetic_ledger(count, users=2000, seed=0):
+    """activity_points CSV 내보내기 형식의 포인트 내역 행 생성"""
+    rng = random.Random(seed)
+    activities = [("post_create", 10), ("comment_create", 3), ("like_received", 1), ("cop_join", 5)]
+    rows = []
+    for i in range(count):
+        activity_type, points = rng.choice(activities)
+        rows.append({
+            "id": f"row-{i}",
+            "user_id": f"user-{rng.randrange(users)}",
+            "points": str(points),
+            "activity_type": activity_type,
+            "created_at": f"2025-{1 + i * 12 // count:02d}-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}:{i % 59:02d}.{i % 1000000:06d}+00",
+        })
+    return rows
+
+def load_image_cases():
+    """이미지 스크립트의 마스크 함수 목록 (numpy/Pillow 가 없으면 빈 목록)"""
+    try:
+        # 스크립트는 라이브러리가 없으면 안내 메시지를 출력하고 exit(1) 함
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            import edit_okman
+            import remove_background
+            import remove_background_improved
+    except (ImportError, SystemExit):
+        print("numpy/Pillow 가 없어 이미지 벤치마크를 건너뜁니다.", file=sys.stderr)
+        return []
+    return [
+        ("image.edit_okman", edit_okman.clear_background_and_text),
+        ("image.remove_background", remove_background.clear_background),
+        ("image.remove_background_improved", remove_background_improved.clear_background),
+    ]
+
+def build_cases(only=None):
+    """(이름, 단위, 작업량, 입력 생성 함수, 측정 함수) 목록"""
+    cases = []
+
+    for name, func in load_image_cases():
+        for width, height in IMAGE_SIZES:
+            cases.append((
+                f"{name}@{width}x{height}", "MP/s", width * height / 1e6,
+                lambda w=width, h=height: synthetic_image(w, h),
+                lambda data, f=func: f(data),
+            ))
+
+    from import_first_engineer import read_roster, generate_sql
+    for count in ROSTER_SIZES:
+        cases.append((
+            f"roster.csv_to_sql@{count}", "rows/s", count,
+            lambda n=count: roster_csv(synthetic_roster(n)),
+            lambda f: generate_sql(read_roster(f)),
+        ))
+
+    from case_records import process_collected_items
+    for count in ITEM_SIZES:
+        cases.append((
+            f"cases.process_collected_items@{count}", "items/s", count,
+            lambda n=count: synthetic_items(n),
+            lambda items: process_collected_items(items, "https://ok-hrd-edu-ai1.lovable.app/admin"),
+        ))
+
+    from aggregate_points import aggregate, empty_state
+    for count in LEDGER_SIZES:
+        cases.append((
+            f"points.aggregate@{count}", "rows/s", count,
+            lambda n=count: synthetic_ledger(n),
+            lambda rows: aggregate(rows, empty_state()),
+        ))
+
+    if only:
+        cases = [case for case in cases if any(word in case[0] for word in only)]
+    return cases
+
+def measure(make_input, func, repeat):
+    """최소 실행 시간(초)과 최대 메모리(바이트) 측정
+
+    입력 생성은 측정에서 제외하고, 메모리는 시간 측정과 별도로 한 번만
+    tracemalloc 으로 측정합니다 (tracemalloc 이 실행 속도를 늦추므로).
+    """
+    best = float("inf")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        for _ in range(repeat):
+            data = make_input()
+            started = time.perf_counter()
+            func(data)
+            best = min(best, time.perf_counter() - started)
+
+        data = make_input()
+        tracemalloc.start()
+        try:
+            func(data)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_history(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+def run(args):
+    cases = build_cases(args.only)
+    results = {}
+    for name, unit, work, make_input, func in cases:
+        seconds, peak = measure(make_input, func, args.repeat)
+        throughput = work / seconds if seconds > 0 else float("inf")
+        results[name] = {
+            "unit": unit,
+            "throughput": round(throughput, 3),
+            "seconds": round(seconds, 6),
+            "peak_bytes": peak,
+        }
+        print(f"{name:<48} {throughput:>14,.1f} {unit:<7} {peak / 1024 / 1024:>9.2f} MiB")
+
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": results,
+    }
+    if args.only:
+        record["only"] = args.only
+
+    if not results:
+        print("\n실행된 경로가 없어 결과를 저장하지 않습니다.", file=sys.stderr)
+        return 1
+
+    # 일부 경로만 실행한 결과는 다음 비교의 기준이 되지 않도록 --save 일 때만 저장
+    save = args.save if args.save is not None else not args.only
+    if save:
+        history = load_history(args.history)
+        history.append(record)
+        with open(args.history, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+        print(f"\n결과를 저장했습니다: {args.history} (총 {len(history)}회)")
+    return 0
+
+def compare(args):
+    history = load_history(args.history)
+    if len(history) < 2:
+        print("비교하려면 최소 두 번의 실행 결과가 필요합니다.", file=sys.stderr)
+        return 0
+
+    if not -len(history) <= args.baseline < len(history):
+        print(f"기준 실행 인덱스가 범위를 벗어났습니다: {args.baseline} (이력 {len(history)}회)", file=sys.stderr)
+        return 1
+
+    base = history[args.baseline]
+    current = history[-1]
+    threshold = args.threshold / 100
+    regressions = 0
+
+    print(f"기준: {base['timestamp']} ({base.get('commit')})  현재: {current['timestamp']} ({current.get('commit')})\n")
+    missing = [name for name in base["results"] if name not in current["results"]]
+    for name, now in current["results"].items():
+        before = base["results"].get(name)
+        if not before:
+            print(f"{name:<48} (신규)")
+            continue
+        speed = now["throughput"] / before["throughput"] - 1 if before["throughput"] else 0.0
+        memory = now["peak_bytes"] / before["peak_bytes"] - 1 if before["peak_bytes"] else 0.0
+        flags = []
+        if speed < -threshold:
+            flags.append("속도 회귀")
+        if memory > threshold:
+            flags.append("메모리 회귀")
+        regressions += bool(flags)
+        print(f"{name:<48} 속도 {speed:+8.1%}  메모리 {memory:+8.1%}  {' / '.join(flags)}")
+
+    for name in missing:
+        print(f"{name:<48} (누락: 기준 실행에는 있었지만 현재 실행에 없음)")
+
+    if regressions or missing:
+        if regressions:
+            print(f"\n{regressions}개 경로에서 {args.threshold:g}% 이상 회귀가 발생했습니다.")
+        if missing:
+            print(f"\n{len(missing)}개 경로가 현재 실행에서 누락되었습니다.")
+        return 1
+    print("\n회귀 없음")
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Python 데이터 처리 경로 벤치마크")
+    parser.add_argument("--history", default=HISTORY_PATH, help="결과 이력 JSON 파일")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("--only", nargs="+", help="이름에 주어진 문자열이 포함된 경로만 실행")
+    run_parser.add_argument("--repeat", type=int, default=5, help="경로별 반복 횟수 (최소 시간 사용)")
+    run_parser.add_argument("--save", action=argparse.BooleanOptionalAction, default=None, help="이력 파일에 저장 여부 (기본값: 전체 실행만 저장, --only 실행은 저장 안 함)")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = sub.add_parser("compare", help="최근 실행을 기준 실행과 비교")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 변화율 (%%)")
+    compare_parser.add_argument("--baseline", type=int, default=-2, help="기준 실행의 이력 인덱스 (기본값: 직전 실행)")
+    compare_parser.set_defaults(handler=compare)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sys.exit(args.handler(args))
+
+if __name__ == "__main__":
+    main()
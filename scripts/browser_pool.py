@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+헤드리스 Chrome 브라우저 풀
+- 뉴스 크롤러와 AI 사례 수집기가 같은 브라우저 인스턴스를 공유
+- 동시에 떠 있는 브라우저 수를 size 개로 제한
+- Selenium 호출은 블로킹이므로 asyncio.to_thread 로 실행
+"""
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def chrome_options(headless=True):
+    """공통 Chrome 옵션 생성"""
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+    else:
+        options.add_argument("--start-maximized")  # 최대화된 창으로 시작
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--lang=ko-KR")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    return options
+
+def create_driver(headless=True):
+    """Chrome 드라이버 생성"""
+    driver = webdriver.Chrome(options=chrome_options(headless))
+    driver.implicitly_wait(5)
+    driver.set_page_load_timeout(30)
+    return driver
+
+class BrowserPool:
+    """최대 size 개의 드라이버를 재사용하는 비동기 브라우저 풀
+
+    드라이버는 처음 필요할 때 생성되고, 작업이 끝나면 쿠키를 지운 뒤
+    다음 작업에 재사용됩니다.
+    """
+
+    def __init__(self, size=2, headless=True):
+        self.size = max(1, size)
+        self.headless = headless
+        self._idle = asyncio.Queue()
+        self._drivers = []
+        self._slots = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+
+    async def _checkout(self):
+        await self._slots.acquire()
+        try:
+            async with self._lock:
+                if self._idle.empty() and len(self._drivers) < self.size:
+                    print(f"[브라우저 풀] 브라우저 시작 ({len(self._drivers) + 1}/{self.size})", file=sys.stderr)
+                    driver = await asyncio.to_thread(create_driver, self.headless)
+                    self._drivers.append(driver)
+                    return driver
+            return await self._idle.get()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _checkin(self, driver):
+        try:
+            await asyncio.to_thread(driver.delete_all_cookies)
+        except Exception:
+            pass
+        self._idle.put_nowait(driver)
+        self._slots.release()
+
+    @asynccontextmanager
+    async def driver(self):
+        """풀에서 드라이버 하나를 빌려오기"""
+        driver = await self._checkout()
+        try:
+            yield driver
+        finally:
+            await self._checkin(driver)
+
+    async def run(self, func, *args, **kwargs):
+        """풀의 드라이버로 블로킹 함수 func(driver, *args, **kwargs) 실행"""
+        async with self.driver() as driver:
+            return await asyncio.to_thread(func, driver, *args, **kwargs)
+
+    async def close(self):
+        """풀의 모든 브라우저 종료"""
+        drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                await asyncio.to_thread(driver.quit)
+            except Exception:
+                pass
+        if drivers:
+            print(f"[브라우저 풀] 브라우저 {len(drivers)}개 종료", file=sys.stderr)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 사례 수집 결과 후처리
+- import_ai_cases.collect_cases() 가 브라우저에서 가져온 원본 항목을 사례 레코드로 변환
+- selenium 없이 import 할 수 있어 벤치마크에서도 사용
+"""
+import sys
+import time
+from datetime import datetime
+
+def process_collected_items(selected_items, current_url):
+    """JavaScript로 수집한 원본 항목을 사례 레코드로 변환"""
+    selected_cases = []
+    for item in selected_items:
+        try:
+            url = item.get("url", current_url) if isinstance(item, dict) else getattr(item, "url", current_url)
+            title = item.get("title", "제목 없음") if isinstance(item, dict) else getattr(item, "title", "제목 없음")
+            content = item.get("content", "") if isinstance(item, dict) else getattr(item, "content", "")
+            
+            # 빈 제목과 내용은 건너뛰기
+            if not title or title == "제목 없음":
+                if not content or len(content.strip()) < 10:
+                    continue
+            
+            external_id = url.split("/")[-1] if "/" in url else f"item_{int(time.time())}"
+            if not external_id or external_id == "" or external_id == "admin":
+                external_id = f"item_{int(time.time())}_{len(selected_cases)}"
+            
+            selected_cases.append({
+                "title": title[:200] if len(title) > 200 else title if title else "제목 없음",
+                "content": content[:5000] if len(content) > 5000 else content,
+                "source_url": url,
+                "external_id": external_id,
+                "published_at": datetime.now().isoformat()
+            })
+            
+            print(f"처리된 항목: {title[:50]}...", file=sys.stderr)
+        except Exception as e:
+            print(f"항목 처리 오류: {str(e)}", file=sys.stderr)
+            continue
+    
+    return selected_cases
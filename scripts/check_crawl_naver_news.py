@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장된 네이버 뉴스 검색 결과(scripts/fixtures/naver_news)로 크롤러 확인
+- serve_saved_pages 로 로컬에서 제공한 2개 페이지를 BrowserPool 로 수집
+- 기사 레코드 필드, 중복 제거, 링크 없는 제목 제외를 검사
+- 헤드리스 Chrome 과 selenium 이 필요합니다.
+
+    python scripts/check_crawl_naver_news.py
+"""
+import os
+import sys
+import asyncio
+from datetime import datetime
+from browser_pool import BrowserPool
+from crawl_naver_news import crawl_naver_news, serve_saved_pages, SOURCE_SITE
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "naver_news")
+
+# (title, content, sourceUrl) - 1페이지, 2페이지 순서
+EXPECTED_ARTICLES = [
+    ("생성형 AI, 금융권 업무 자동화 속도 낸다",
+     "금융사들이 생성형 AI를 상담과 내부 문서 작업에 도입하고 있다.",
+     "https://n.news.naver.com/mnews/article/001/0000000001"),
+    ("사내 AI 엔지니어 양성 프로그램 2기 출범",
+     "현업 직원을 대상으로 한 AI 교육 과정이 두 번째 기수를 맞았다.",
+     "https://n.news.naver.com/mnews/article/002/0000000002"),
+    ("요약 없는 AI 기사",
+     "",
+     "https://n.news.naver.com/mnews/article/003/0000000003"),
+    ("AI 규제 가이드라인 초안 공개",
+     "정부가 AI 서비스 사업자를 위한 가이드라인 초안을 내놨다.",
+     "https://n.news.naver.com/mnews/article/004/0000000004"),
+]
+
+RECORD_FIELDS = {"title", "content", "sourceUrl", "sourceSite", "publishedAt"}
+
+async def crawl_fixture():
+    server, base_url = serve_saved_pages(FIXTURE_DIR)
+    try:
+        async with BrowserPool(size=2) as pool:
+            return await crawl_naver_news(pool, ["AI"], pages=2, limit=0, base_url=base_url)
+    finally:
+        server.shutdown()
+
+def check_articles(articles):
+    """기사 레코드 검사 후 실패 메시지 목록 반환"""
+    errors = []
+    actual = [(a.get("title"), a.get("content"), a.get("sourceUrl")) for a in articles]
+    if actual != EXPECTED_ARTICLES:
+        errors.append(f"기사 목록이 다릅니다:\n  기대값: {EXPECTED_ARTICLES}\n  실제값: {actual}")
+
+    for article in articles:
+        if set(article) != RECORD_FIELDS:
+            errors.append(f"레코드 필드가 다릅니다: {sorted(article)}")
+        if article.get("sourceSite") != SOURCE_SITE:
+            errors.append(f"sourceSite 가 다릅니다: {article.get('sourceSite')}")
+        published_at = article.get("publishedAt", "")
+        try:
+            if not published_at.endswith("Z"):
+                raise ValueError(published_at)
+            datetime.fromisoformat(published_at)
+        except ValueError:
+            errors.append(f"publishedAt 형식이 잘못되었습니다: {published_at}")
+    return errors
+
+def main():
+    errors = check_articles(asyncio.run(crawl_fixture()))
+    if errors:
+        for error in errors:
+            print(f"실패: {error}", file=sys.stderr)
+        sys.exit(1)
+    print(f"성공: 저장된 페이지에서 {len(EXPECTED_ARTICLES)}개 기사를 올바르게 수집했습니다.")
+
+if __name__ == "__main__":
+    main()
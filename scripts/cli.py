@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Community Python 도구 단일 진입점
+
+    python scripts/cli.py import-cases    [--email ... --password ... --headless]
+    python scripts/cli.py crawl-news      [--query AI --pages 2 --with-cases]
+    python scripts/cli.py import-roster   --csv 명단.csv [--output first_engineer_insert.sql --photo-manifest ...]
+    python scripts/cli.py ingest-photos   --input 사진폴더 [--sizes 40 80 160 --workers 4]
+    python scripts/cli.py images OP       [--input ... --output ...]
+    python scripts/cli.py aggregate-points --ledger activity_points.csv [--full | --mark-applied BATCH_ID]
+
+설정은 플래그 또는 환경 변수로 지정합니다 (플래그가 우선).
+selenium, numpy, Pillow 등은 해당 서브커맨드를 실행할 때만 import 하므로
+--help 나 인자 오류 시에는 표준 라이브러리만 로드됩니다.
+"""
+import os
+import sys
+import argparse
+import importlib
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+# 이미지 작업: (모듈, 파일 처리 함수, 기본 입력, 기본 출력)
+IMAGE_OPERATIONS = {
+    "remove-background": ("remove_background", "remove_background", "public/okman3.png", "public/okman3_transparent.png"),
+    "remove-background-improved": ("remove_background_improved", "remove_background_improved", "public/okman3.png", "public/okman3_transparent.png"),
+    "edit-okman": ("edit_okman", "remove_background_and_text", "public/okman.png", "public/okman.png"),
+}
+
+def env_flag(name):
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def lazy(module_name, func_name="run_cli"):
+    """서브커맨드 실행 시점에 모듈을 import 하여 func_name(args) 호출"""
+    def handler(args):
+        module = importlib.import_module(module_name)
+        return getattr(module, func_name)(args)
+    return handler
+
+def run_images(args):
+    module_name, func_name, default_input, default_output = IMAGE_OPERATIONS[args.operation]
+    input_file = args.input or os.path.join(PROJECT_DIR, default_input)
+    output_file = args.output or os.path.join(PROJECT_DIR, default_output)
+
+    module = importlib.import_module(module_name)
+    try:
+        getattr(module, func_name)(input_file, output_file)
+    except FileNotFoundError:
+        print(f"파일을 찾을 수 없습니다: {input_file}")
+        return 1
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="AI Community Python 도구")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    cases = sub.add_parser("import-cases", help="AI 활용 사례 게시글 수집 (selenium)")
+    cases.add_argument("--email", default=os.environ.get("AI_CASES_EMAIL"), help="로그인 이메일 (환경 변수 AI_CASES_EMAIL)")
+    cases.add_argument("--password", default=os.environ.get("AI_CASES_PASSWORD"), help="로그인 비밀번호 (환경 변수 AI_CASES_PASSWORD)")
+    cases.add_argument("--headless", action=argparse.BooleanOptionalAction, default=env_flag("AI_CASES_HEADLESS"), help="브라우저 창 없이 실행 (환경 변수 AI_CASES_HEADLESS)")
+    cases.add_argument("--linger", type=int, default=5, help="수집 후 브라우저를 열어둘 시간(초)")
+    cases.add_argument("--selector-profile", default=os.environ.get("LOGIN_SELECTOR_PROFILE"), help="로그인 셀렉터 프로필 경로 (환경 변수 LOGIN_SELECTOR_PROFILE)")
+    cases.set_defaults(handler=lazy("import_ai_cases"))
+
+    news = sub.add_parser("crawl-news", help="네이버 뉴스 검색 결과 수집 (selenium)")
+    news.add_argument("--query", action="append", dest="queries", help="검색어 (여러 번 지정 가능, 기본값: AI)")
+    news.add_argument("--pages", type=int, default=1, help="검색어별 수집할 페이지 수")
+    news.add_argument("--limit", type=int, default=20, help="반환할 최대 기사 수 (0 이면 제한 없음)")
+    news.add_argument("--pool-size", type=int, default=os.environ.get("BROWSER_POOL_SIZE", "2"), help="동시에 사용할 브라우저 수 (환경 변수 BROWSER_POOL_SIZE)")
+    news.add_argument("--base-url", default=os.environ.get("NAVER_NEWS_SEARCH_URL"), help="검색 URL (테스트용으로 변경 가능)")
+    news.add_argument("--serve", metavar="DIR", help="저장된 검색 결과 HTML 디렉터리를 로컬에서 제공하여 크롤링")
+    news.add_argument("--with-cases", action="store_true", help="AI 사례 수집도 같은 브라우저 풀에서 함께 실행")
+    news.add_argument("--email", default=os.environ.get("AI_CASES_EMAIL"), help="--with-cases 로그인 이메일 (환경 변수 AI_CASES_EMAIL)")
+    news.add_argument("--password", default=os.environ.get("AI_CASES_PASSWORD"), help="--with-cases 로그인 비밀번호 (환경 변수 AI_CASES_PASSWORD)")
+    news.set_defaults(handler=lazy("crawl_naver_news"))
+
+    roster = sub.add_parser("import-roster", help="AI Engineer 명단 CSV 를 SQL INSERT 문으로 변환")
+    roster.add_argument("--csv", default=os.environ.get("ROSTER_CSV"), help="명단 CSV 경로 (환경 변수 ROSTER_CSV)")
+    roster.add_argument("--output", default=os.environ.get("ROSTER_SQL_OUTPUT", os.path.join(SCRIPTS_DIR, "first_engineer_insert.sql")), help="생성할 SQL 파일 경로 (환경 변수 ROSTER_SQL_OUTPUT)")
+    roster.add_argument("--photo-manifest", default=os.environ.get("ROSTER_PHOTO_MANIFEST"), help="ingest-photos manifest 경로 - 지정하면 ai_engineers.photo_url UPDATE 문도 생성 (환경 변수 ROSTER_PHOTO_MANIFEST)")
+    roster.set_defaults(handler=lazy("import_first_engineer"))
+
+    photos = sub.add_parser("ingest-photos", help="사번별 명단 사진을 정사각형 썸네일로 변환하고 manifest 생성 (numpy, Pillow)")
+    photos.add_argument("--input", default=os.environ.get("ROSTER_PHOTOS_DIR"), help="사번.jpg 형식의 원본 사진 폴더 (환경 변수 ROSTER_PHOTOS_DIR)")
+    photos.add_argument("--mapping", help="파일명이 사번이 아닌 경우 employee_number,filename 컬럼의 CSV")
+    photos.add_argument("--output", default=os.path.join(PROJECT_DIR, "public", "engineers"), help="썸네일 저장 폴더 (기본값: public/engineers)")
+    photos.add_argument("--url-prefix", default="/engineers", help="manifest 의 photo_url 접두사")
+    photos.add_argument("--manifest", default=os.environ.get("ROSTER_PHOTO_MANIFEST", os.path.join(SCRIPTS_DIR, "engineer_photos.json")), help="manifest 경로 (환경 변수 ROSTER_PHOTO_MANIFEST)")
+    photos.add_argument("--sizes", type=int, nargs="+", default=[40, 80, 160], help="생성할 정사각형 크기(px)")
+    photos.add_argument("--workers", type=int, default=0, help="프로세스 수 (기본값: CPU 수)")
+    photos.add_argument("--force", action="store_true", help="변경되지 않은 사진도 다시 처리")
+    photos.set_defaults(handler=lazy("ingest_photos"))
+
+    images = sub.add_parser("images", help="캐릭터 이미지 배경 제거 (numpy, Pillow)")
+    images.add_argument("operation", choices=sorted(IMAGE_OPERATIONS), help="수행할 작업")
+    images.add_argument("--input", help="입력 이미지 경로 (기본값: 작업별 public/ 이미지)")
+    images.add_argument("--output", help="출력 이미지 경로 (기본값: 작업별 public/ 이미지)")
+    images.set_defaults(handler=run_images)
+
+    points = sub.add_parser("aggregate-points", help="활동 포인트/뱃지 자격 집계 후 upsert SQL 생성")
+    points.add_argument("--ledger", default=os.environ.get("POINTS_LEDGER_CSV"), help="activity_points CSV 내보내기 경로 (환경 변수 POINTS_LEDGER_CSV)")
+    points.add_argument("--state", default=os.environ.get("POINTS_STATE", os.path.join(SCRIPTS_DIR, ".points_state.json")), help="체크포인트/누적값 상태 파일 (환경 변수 POINTS_STATE)")
+    points.add_argument("--output", default=os.environ.get("POINTS_SUMMARY_OUTPUT", os.path.join(SCRIPTS_DIR, "user_point_summary_upsert.sql")), help="생성할 upsert SQL 파일 경로 (환경 변수 POINTS_SUMMARY_OUTPUT)")
+    points.add_argument("--rules", help="뱃지 자격 조건 JSON 파일 (기본값: 내장 조건)")
+    points.add_argument("--batch-size", type=int, default=500, help="INSERT 문 하나에 담을 행 수")
+    points.add_argument("--full", action="store_true", help="체크포인트를 무시하고 전체 내역을 다시 집계")
+    points.add_argument("--mark-applied", metavar="BATCH_ID", help="해당 배치의 SQL 을 적용했음을 표시 (그 배치에 최신 값이 담긴 사용자만 미반영 목록에서 제거)")
+    points.set_defaults(handler=lazy("aggregate_points"))
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sys.exit(args.handler(args) or 0)
+
+if __name__ == "__main__":
+    main()
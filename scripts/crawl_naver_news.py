@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+네이버 뉴스 검색 크롤러 (crawler-server/server.js 의 crawlNaverNews 와 같은 결과)
+- 여러 검색어/페이지를 BrowserPool 로 동시에 수집
+- --with-cases 옵션으로 AI 사례 수집도 같은 브라우저 풀에서 함께 실행
+- --serve 옵션으로 저장해 둔 검색 결과 HTML 을 로컬에서 제공하여 테스트
+
+저장된 HTML 테스트:
+    python scripts/cli.py crawl-news --serve saved_pages --query AI --pages 2
+    (saved_pages/AI_1.html, saved_pages/AI_2.html, 없으면 saved_pages/index.html)
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from datetime import datetime, timezone
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlencode, urlsplit, parse_qs
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from browser_pool import BrowserPool
+
+NAVER_NEWS_SEARCH_URL = "https://search.naver.com/search.naver"
+SOURCE_SITE = "네이버 뉴스"
+HEADLINE_SELECTOR = "span.sds-comps-text-type-headline1"
+PAGE_SIZE = 10
+
+# server.js 와 동일한 기사 추출 로직
+EXTRACT_ARTICLES_JS = """
+    var titleElements = document.querySelectorAll('span.sds-comps-text-type-headline1');
+    var results = [];
+    var seenLinks = {};
+
+    titleElements.forEach(function(titleSpan) {
+        try {
+            var title = (titleSpan.textContent || '').trim();
+            if (!title) return;
+
+            // 제목을 감싸는 가장 가까운 a 태그 찾기
+            var aTag = titleSpan.closest('a');
+            if (!aTag || !aTag.href) return;
+
+            var link = aTag.href;
+            if (seenLinks[link]) return;
+            seenLinks[link] = true;
+
+            // 요약 추출
+            var content = '';
+            var current = aTag;
+            while (current) {
+                if (current.tagName === 'DIV' && typeof current.className === 'string' &&
+                    current.className.includes('sds-comps-base-layout')) {
+                    var bodySpan = current.querySelector('span.sds-comps-text-type-body1');
+                    if (bodySpan) {
+                        content = (bodySpan.textContent || '').trim();
+                    }
+                    break;
+                }
+                current = current.parentElement;
+            }
+
+            results.push({title: title, content: content, link: link});
+        } catch (e) {
+            // 개별 기사 파싱 실패 시 continue
+        }
+    });
+    return results;
+"""
+
+def search_url(query, page, base_url=NAVER_NEWS_SEARCH_URL):
+    """검색어/페이지 번호로 네이버 뉴스 검색 URL 생성"""
+    params = {
+        "ssc": "tab.news.all",
+        "where": "news",
+        "sm": "tab_jum",
+        "query": query,
+    }
+    if page > 1:
+        params["start"] = (page - 1) * PAGE_SIZE + 1
+    return f"{base_url}?{urlencode(params)}"
+
+def fetch_search_page(driver, url, max_scrolls=5):
+    """검색 결과 한 페이지에서 기사 목록 추출 (블로킹, 풀의 드라이버로 실행)"""
+    print(f"[크롤링] 접속 중: {url}", file=sys.stderr)
+    driver.get(url)
+
+    try:
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, HEADLINE_SELECTOR))
+        )
+    except TimeoutException:
+        print(f"[크롤링] 셀렉터를 찾을 수 없습니다: {url}", file=sys.stderr)
+        return []
+
+    # 기사 수가 더 늘지 않을 때까지만 스크롤 (고정 대기 대신)
+    count = len(driver.find_elements(By.CSS_SELECTOR, HEADLINE_SELECTOR))
+    for _ in range(max_scrolls):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+        try:
+            WebDriverWait(driver, 1.5, poll_frequency=0.25).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, HEADLINE_SELECTOR)) > count
+            )
+        except TimeoutException:
+            break
+        count = len(driver.find_elements(By.CSS_SELECTOR, HEADLINE_SELECTOR))
+
+    return driver.execute_script(EXTRACT_ARTICLES_JS) or []
+
+def to_article_record(article):
+    """server.js 와 같은 형식의 기사 레코드로 변환"""
+    return {
+        "title": article["title"],
+        "content": article.get("content", ""),
+        "sourceUrl": article["link"],
+        "sourceSite": SOURCE_SITE,
+        "publishedAt": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+    }
+
+async def crawl_naver_news(pool, queries=("AI",), pages=1, limit=20, base_url=NAVER_NEWS_SEARCH_URL):
+    """여러 검색어/페이지를 동시에 수집하여 중복 제거된 기사 레코드 반환"""
+    urls = [search_url(query, page, base_url) for query in queries for page in range(1, pages + 1)]
+    print(f"[크롤링] 네이버 뉴스 크롤링 시작 ({len(urls)}개 페이지)", file=sys.stderr)
+
+    results = await asyncio.gather(
+        *(pool.run(fetch_search_page, url) for url in urls),
+        return_exceptions=True
+    )
+
+    articles = []
+    seen_links = set()
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"[크롤링] 페이지 수집 오류 ({url}): {str(result)}", file=sys.stderr)
+            continue
+        for article in result:
+            if article.get("link") in seen_links:
+                continue
+            seen_links.add(article.get("link"))
+            articles.append(to_article_record(article))
+
+    print(f"[크롤링] 네이버 뉴스 {len(articles)}개 기사 수집", file=sys.stderr)
+    return articles[:limit] if limit else articles
+
+class SavedPageHandler(SimpleHTTPRequestHandler):
+    """저장된 검색 결과 HTML 제공: ?query=AI&start=11 -> AI_2.html (없으면 index.html)"""
+
+    def do_GET(self):
+        params = parse_qs(urlsplit(self.path).query)
+        query = params.get("query", [""])[0]
+        try:
+            start = int(params.get("start", ["1"])[0])
+        except ValueError:
+            start = 1
+        page = max(start - 1, 0) // PAGE_SIZE + 1
+        for name in (f"{query}_{page}.html", "index.html"):
+            if os.path.isfile(os.path.join(self.directory, name)):
+                self.path = "/" + name
+                break
+        return super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+def serve_saved_pages(directory):
+    """저장된 HTML 디렉터리를 로컬 HTTP 서버로 제공하고 검색 URL 반환"""
+    server = HTTPServer(("127.0.0.1", 0), partial(SavedPageHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    print(f"[크롤링] 저장된 페이지 제공 중: http://{host}:{port}/ ({directory})", file=sys.stderr)
+    return server, f"http://{host}:{port}/search.naver"
+
+async def run(args):
+    base_url = args.base_url or NAVER_NEWS_SEARCH_URL
+    server = None
+    if args.serve:
+        server, base_url = serve_saved_pages(args.serve)
+
+    try:
+        async with BrowserPool(size=args.pool_size) as pool:
+            jobs = {"articles": crawl_naver_news(pool, args.queries or ["AI"], args.pages, args.limit, base_url)}
+            if args.with_cases:
+                from import_ai_cases import import_cases
+                jobs["cases"] = import_cases(pool, args.email, args.password)
+            # 한 작업이 실패해도 다른 작업이 끝날 때까지 기다린 뒤 풀을 닫음
+            # (to_thread 로 실행 중인 브라우저 작업은 취소되지 않으므로 먼저 닫으면 드라이버가 종료됨)
+            results = await asyncio.gather(*jobs.values(), return_exceptions=True)
+    finally:
+        if server:
+            server.shutdown()
+
+    # 작업별 결과/오류를 따로 보고 (예: 로그인 실패 시 cases_error, 뉴스 결과는 유지)
+    output = {"success": True}
+    for key, result in zip(jobs, results):
+        if isinstance(result, Exception):
+            print(f"[크롤링] {key} 작업 오류: {str(result)}", file=sys.stderr)
+            output["success"] = False
+            output[key] = []
+            output[f"{key}_error"] = str(result)
+        else:
+            output[key] = result
+    return output
+
+def run_cli(args):
+    """cli.py crawl-news 서브커맨드"""
+    if args.with_cases and (not args.email or not args.password):
+        print(json.dumps({
+            "success": False,
+            "error": "로그인 정보가 없습니다. --email/--password 또는 AI_CASES_EMAIL/AI_CASES_PASSWORD 를 지정하세요."
+        }, ensure_ascii=False), file=sys.stderr)
+        return 1
+    
+    started = time.time()
+    try:
+        output = asyncio.run(run(args))
+    except Exception as e:
+        print(json.dumps({
+            "success": False,
+            "error": f"크롤링 중 오류가 발생했습니다: {str(e)}"
+        }, ensure_ascii=False), file=sys.stderr)
+        return 1
+    print(f"[크롤링] 완료 ({time.time() - started:.1f}초)", file=sys.stderr)
+    print(json.dumps(output, ensure_ascii=False))
+    return 0 if output["success"] else 1
+
+if __name__ == "__main__":
+    from cli import main
+    main(["crawl-news", *sys.argv[1:]])
@@ -12,12 +12,8 @@ except ImportError:
     print("pip install Pillow numpy")
     exit(1)
 
-def remove_background_and_text(input_path, output_path):
-    """배경을 투명하게 만들고 상단 텍스트 제거"""
-    # 이미지 열기
-    img = Image.open(input_path).convert("RGBA")
-    data = np.array(img)
-    
+def clear_background_and_text(data):
+    """RGBA 배열에서 흰색 배경과 상단 텍스트를 투명하게 처리 (data 를 직접 수정)"""
     # 흰색 배경을 투명하게 만들기
     # RGB 값이 모두 높은 픽셀(흰색)을 투명하게
     white_threshold = 240
@@ -26,9 +22,16 @@ def remove_background_and_text(input_path, output_path):
     
     # 상단 영역(텍스트가 있을 수 있는 부분) 처리
     # 상단 20% 영역에서 흰색/밝은 색을 투명하게
-    top_area = int(img.height * 0.2)
+    top_area = int(data.shape[0] * 0.2)
     top_mask = (data[:top_area, :, 0] > 200) & (data[:top_area, :, 1] > 200) & (data[:top_area, :, 2] > 200)
     data[:top_area, :, 3][top_mask] = 0
+    return data
+
+def remove_background_and_text(input_path, output_path):
+    """배경을 투명하게 만들고 상단 텍스트 제거"""
+    # 이미지 열기
+    img = Image.open(input_path).convert("RGBA")
+    data = clear_background_and_text(np.array(img))
     
     # 결과 이미지 저장
     result = Image.fromarray(data)
@@ -36,12 +39,6 @@ def remove_background_and_text(input_path, output_path):
     print(f"이미지 편집 완료: {output_path}")
 
 if __name__ == "__main__":
-    input_file = "public/okman.png"
-    output_file = "public/okman.png"  # 같은 파일에 덮어쓰기
-    
-    try:
-        remove_background_and_text(input_file, output_file)
-    except FileNotFoundError:
-        print(f"파일을 찾을 수 없습니다: {input_file}")
-    except Exception as e:
-        print(f"오류 발생: {e}")
+    import sys
+    from cli import main
+    main(["images", "edit-okman", *sys.argv[1:]])
@@ -1,319 +1,380 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import os
 import sys
 import json
 import time
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from browser_pool import create_driver
+from case_records import process_collected_items
 
-def login(driver, email, password):
-    """사이트에 자동 로그인"""
-    try:
-        print("로그인 페이지로 이동 중...", file=sys.stderr)
-        driver.get("https://ok-hrd-edu-ai1.lovable.app/")
-        
-        # 페이지가 완전히 로드될 때까지 대기
-        print("페이지 로드 대기 중...", file=sys.stderr)
-        WebDriverWait(driver, 30).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
-        time.sleep(3)  # 추가 대기 시간
-        
-        print(f"현재 URL: {driver.current_url}", file=sys.stderr)
-        print(f"페이지 제목: {driver.title}", file=sys.stderr)
-        
-        # JavaScript로 모든 input 요소 정보 수집
-        print("페이지의 모든 input 요소 확인 중...", file=sys.stderr)
-        all_inputs_info = driver.execute_script("""
-            var inputs = document.querySelectorAll('input');
-            var info = [];
+# 로그인 셀렉터 프로필 캐시 경로 (LOGIN_SELECTOR_PROFILE 환경 변수로 변경 가능)
+SELECTOR_PROFILE_PATH = os.environ.get(
+    "LOGIN_SELECTOR_PROFILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".login_selector_profile.json")
+)
+
+LOGIN_URL = "https://ok-hrd-edu-ai1.lovable.app/"
+
+# 요소별 탐색 후보 셀렉터 (캐시된 셀렉터가 맞지 않을 때만 사용)
+LOGIN_ELEMENT_SELECTORS = {
+    "email": {
+        "visible": False,
+        "selectors": [
+            'input[type="email"]',
+            'input[name="email"]',
+            'input[id="email"]',
+            'input[placeholder*="email" i]',
+            'input[placeholder*="이메일"]',
+            'input[type="text"][name*="email" i]',
+            'input[type="text"][id*="email" i]'
+        ]
+    },
+    "password": {
+        "visible": False,
+        "selectors": [
+            'input[type="password"]',
+            'input[name="password"]',
+            'input[id="password"]',
+            'input[placeholder*="password" i]',
+            'input[placeholder*="비밀번호"]',
+            'input[name*="pass" i]'
+        ]
+    },
+    "submit": {
+        "visible": True,
+        "selectors": [
+            'button[type="submit"]',
+            'input[type="submit"]',
+            'button[class*="login" i]',
+            'button[class*="submit" i]',
+            'button.btn-primary',
+            'button[class*="primary" i]'
+        ]
+    }
+}
+
+# 캐시 -> 후보 셀렉터 -> 텍스트/속성 휴리스틱 순으로 모든 요소를 한 번에 찾는 스크립트
+RESOLVE_LOGIN_ELEMENTS_JS = """
+    var cached = arguments[0] || {};
+    var candidates = arguments[1];
+    
+    function isVisible(elem) {
+        return elem.offsetParent !== null;
+    }
+    
+    function query(selector, needsVisible) {
+        try {
+            var elem = document.querySelector(selector);
+            if (elem && (!needsVisible || isVisible(elem))) {
+                return elem;
+            }
+        } catch (e) {}
+        return null;
+    }
+    
+    // 휴리스틱으로 찾은 요소를 다음 실행에서 재사용할 수 있는 셀렉터로 변환
+    function selectorFor(elem) {
+        var tag = elem.tagName.toLowerCase();
+        var options = [];
+        if (elem.id) options.push(tag + '[id="' + CSS.escape(elem.id) + '"]');
+        if (elem.name) options.push(tag + '[name="' + CSS.escape(elem.name) + '"]');
+        if (elem.type) options.push(tag + '[type="' + CSS.escape(elem.type) + '"]');
+        for (var i = 0; i < options.length; i++) {
+            if (document.querySelector(options[i]) === elem) {
+                return options[i];
+            }
+        }
+        return null;
+    }
+    
+    var heuristics = {
+        email: function() {
+            var inputs = document.querySelectorAll('input[type="text"], input[type="email"]');
             for (var i = 0; i < inputs.length; i++) {
                 var inp = inputs[i];
-                info.push({
-                    index: i,
-                    type: inp.type || '',
-                    name: inp.name || '',
-                    id: inp.id || '',
-                    placeholder: inp.placeholder || '',
-                    className: inp.className || '',
-                    tagName: inp.tagName || ''
-                });
-            }
-            return info;
-        """)
-        
-        print(f"페이지에 {len(all_inputs_info)}개의 input 요소가 있습니다:", file=sys.stderr)
-        for inp_info in all_inputs_info:
-            print(f"  Input {inp_info['index']}: type={inp_info['type']}, name={inp_info['name']}, id={inp_info['id']}, placeholder={inp_info['placeholder']}", file=sys.stderr)
-        
-        # JavaScript로 이메일 입력 필드 찾기
-        email_input = None
-        try:
-            email_input = driver.execute_script("""
-                // 여러 방법으로 이메일 입력 필드 찾기
-                var selectors = [
-                    'input[type="email"]',
-                    'input[name="email"]',
-                    'input[id="email"]',
-                    'input[placeholder*="email" i]',
-                    'input[placeholder*="이메일"]',
-                    'input[type="text"][name*="email" i]',
-                    'input[type="text"][id*="email" i]'
-                ];
-                
-                for (var i = 0; i < selectors.length; i++) {
-                    var elem = document.querySelector(selectors[i]);
-                    if (elem) {
-                        elem.scrollIntoView({behavior: 'smooth', block: 'center'});
-                        return elem;
-                    }
+                var name = (inp.name || '').toLowerCase();
+                var id = (inp.id || '').toLowerCase();
+                var placeholder = (inp.placeholder || '').toLowerCase();
+                if (name.includes('email') || id.includes('email') || placeholder.includes('email') || placeholder.includes('이메일')) {
+                    return inp;
                 }
-                
-                // 모든 input 중에서 이메일로 보이는 것 찾기
-                var inputs = document.querySelectorAll('input[type="text"], input[type="email"]');
-                for (var i = 0; i < inputs.length; i++) {
-                    var inp = inputs[i];
-                    var name = (inp.name || '').toLowerCase();
-                    var id = (inp.id || '').toLowerCase();
-                    var placeholder = (inp.placeholder || '').toLowerCase();
-                    if (name.includes('email') || id.includes('email') || placeholder.includes('email') || placeholder.includes('이메일')) {
-                        inp.scrollIntoView({behavior: 'smooth', block: 'center'});
-                        return inp;
-                    }
+            }
+            return null;
+        },
+        password: function() {
+            return document.querySelector('input[type="password"]');
+        },
+        submit: function() {
+            var buttons = document.querySelectorAll('button, input[type="submit"]');
+            for (var i = 0; i < buttons.length; i++) {
+                var btn = buttons[i];
+                var text = (btn.textContent || btn.value || '').toLowerCase();
+                var className = (typeof btn.className === 'string' ? btn.className : '').toLowerCase();
+                if ((text.includes('로그인') || text.includes('login') ||
+                     className.includes('login') || className.includes('submit')) && isVisible(btn)) {
+                    return btn;
                 }
-                return null;
-            """)
-        except Exception as e:
-            print(f"JavaScript로 이메일 필드 찾기 오류: {str(e)}", file=sys.stderr)
+            }
+            return document.querySelector('button[type="submit"], input[type="submit"]');
+        }
+    };
+    
+    var result = {};
+    Object.keys(candidates).forEach(function(key) {
+        var spec = candidates[key];
+        var elem = null;
+        var selector = null;
+        var source = null;
         
-        # Python으로도 찾기 시도
-        if not email_input:
-            email_selectors = [
-                (By.NAME, "email"),
-                (By.ID, "email"),
-                (By.CSS_SELECTOR, "input[type='email']"),
-                (By.CSS_SELECTOR, "input[name='email']"),
-                (By.CSS_SELECTOR, "input[id='email']"),
-                (By.CSS_SELECTOR, "input[type='text'][name*='email' i]"),
-                (By.XPATH, "//input[@type='email']"),
-                (By.XPATH, "//input[@name='email']"),
-                (By.XPATH, "//input[@id='email']")
-            ]
-            
-            for selector_type, selector_value in email_selectors:
-                try:
-                    print(f"이메일 입력 필드 찾기 시도: {selector_type} = {selector_value}", file=sys.stderr)
-                    email_input = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((selector_type, selector_value))
-                    )
-                    print(f"이메일 입력 필드 찾음: {selector_type} = {selector_value}", file=sys.stderr)
-                    break
-                except:
-                    continue
+        if (cached[key]) {
+            elem = query(cached[key], spec.visible);
+            if (elem) {
+                selector = cached[key];
+                source = 'cache';
+            }
+        }
         
-        if not email_input:
-            raise Exception("이메일 입력 필드를 찾을 수 없습니다. 페이지 구조를 확인해주세요.")
+        for (var i = 0; !elem && i < spec.selectors.length; i++) {
+            elem = query(spec.selectors[i], spec.visible);
+            if (elem) {
+                selector = spec.selectors[i];
+                source = 'discovery';
+            }
+        }
         
-        # 이메일 입력
-        driver.execute_script("arguments[0].value = '';", email_input)
-        email_input.clear()
-        email_input.send_keys(email)
-        print("이메일 입력 완료", file=sys.stderr)
-        time.sleep(1)
+        if (!elem && heuristics[key]) {
+            elem = heuristics[key]();
+            if (elem) {
+                selector = selectorFor(elem);
+                source = 'heuristic';
+            }
+        }
         
-        # JavaScript로 비밀번호 입력 필드 찾기
-        password_input = None
+        if (elem) {
+            elem.scrollIntoView({block: 'center'});
+            result[key] = {element: elem, selector: selector, source: source};
+        } else {
+            result[key] = null;
+        }
+    });
+    return result;
+"""
+
+def load_selector_profile(path=SELECTOR_PROFILE_PATH):
+    """저장된 로그인 셀렉터 프로필 읽기 (없거나 손상된 경우 빈 프로필)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            profiles = json.load(f)
+        return profiles.get(LOGIN_URL, {}).get("selectors", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+def save_selector_profile(selectors, path=SELECTOR_PROFILE_PATH):
+    """로그인에 성공한 셀렉터를 프로필에 저장"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            profiles = json.load(f)
+        if not isinstance(profiles, dict):
+            profiles = {}
+    except (OSError, ValueError):
+        profiles = {}
+    
+    profiles[LOGIN_URL] = {
+        "selectors": selectors,
+        "updated_at": datetime.now().isoformat()
+    }
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(profiles, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"셀렉터 프로필 저장 실패: {str(e)}", file=sys.stderr)
+
+def drop_selector_profile(path=SELECTOR_PROFILE_PATH):
+    """맞지 않게 된 로그인 셀렉터 프로필 삭제 (다른 URL 의 프로필은 유지)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            profiles = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(profiles, dict) and profiles.pop(LOGIN_URL, None) is not None:
         try:
-            password_input = driver.execute_script("""
-                // 여러 방법으로 비밀번호 입력 필드 찾기
-                var selectors = [
-                    'input[type="password"]',
-                    'input[name="password"]',
-                    'input[id="password"]',
-                    'input[placeholder*="password" i]',
-                    'input[placeholder*="비밀번호"]',
-                    'input[name*="pass" i]'
-                ];
-                
-                for (var i = 0; i < selectors.length; i++) {
-                    var elem = document.querySelector(selectors[i]);
-                    if (elem) {
-                        elem.scrollIntoView({behavior: 'smooth', block: 'center'});
-                        return elem;
-                    }
-                }
-                
-                // 모든 input 중에서 비밀번호로 보이는 것 찾기
-                var inputs = document.querySelectorAll('input[type="password"]');
-                if (inputs.length > 0) {
-                    inputs[0].scrollIntoView({behavior: 'smooth', block: 'center'});
-                    return inputs[0];
-                }
-                return null;
-            """)
-        except Exception as e:
-            print(f"JavaScript로 비밀번호 필드 찾기 오류: {str(e)}", file=sys.stderr)
-        
-        # Python으로도 찾기 시도
-        if not password_input:
-            password_selectors = [
-                (By.NAME, "password"),
-                (By.ID, "password"),
-                (By.CSS_SELECTOR, "input[type='password']"),
-                (By.CSS_SELECTOR, "input[name='password']"),
-                (By.XPATH, "//input[@type='password']")
-            ]
-            
-            for selector_type, selector_value in password_selectors:
-                try:
-                    print(f"비밀번호 입력 필드 찾기 시도: {selector_type} = {selector_value}", file=sys.stderr)
-                    password_input = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((selector_type, selector_value))
-                    )
-                    print(f"비밀번호 입력 필드 찾음: {selector_type} = {selector_value}", file=sys.stderr)
-                    break
-                except:
-                    continue
-        
-        if not password_input:
-            raise Exception("비밀번호 입력 필드를 찾을 수 없습니다")
-        
-        # 비밀번호 입력
-        driver.execute_script("arguments[0].value = '';", password_input)
-        password_input.clear()
-        password_input.send_keys(password)
-        print("비밀번호 입력 완료", file=sys.stderr)
-        time.sleep(1)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(profiles, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"셀렉터 프로필 삭제 실패: {str(e)}", file=sys.stderr)
+
+def resolve_login_elements(driver, profile, timeout=20):
+    """이메일/비밀번호/로그인 버튼을 한 번의 스크립트 호출로 찾기
+    
+    모든 요소가 나타날 때까지 같은 스크립트를 폴링하므로, 셀렉터마다
+    개별 대기 시간이 누적되지 않습니다.
+    """
+    elements = {}
+    
+    def all_resolved(d):
+        elements.clear()
+        elements.update(d.execute_script(RESOLVE_LOGIN_ELEMENTS_JS, profile, LOGIN_ELEMENT_SELECTORS) or {})
+        return all(elements.get(key) for key in LOGIN_ELEMENT_SELECTORS)
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.5).until(all_resolved)
+    except TimeoutException:
+        pass
+    return elements
+
+def print_login_debug_info(driver):
+    """요소를 찾지 못했을 때 페이지의 input/button 정보 출력 (디버깅용)"""
+    try:
+        info = driver.execute_script("""
+            var describe = function(elem, i) {
+                return {
+                    index: i,
+                    tagName: elem.tagName || '',
+                    type: elem.type || '',
+                    name: elem.name || '',
+                    id: elem.id || '',
+                    placeholder: elem.placeholder || '',
+                    className: typeof elem.className === 'string' ? elem.className : '',
+                    text: (elem.textContent || '').trim().slice(0, 50)
+                };
+            };
+            return {
+                inputs: Array.prototype.map.call(document.querySelectorAll('input'), describe),
+                buttons: Array.prototype.map.call(document.querySelectorAll('button'), describe)
+            };
+        """)
+        print(f"페이지에 {len(info['inputs'])}개의 input 요소가 있습니다:", file=sys.stderr)
+        for inp_info in info['inputs']:
+            print(f"  Input {inp_info['index']}: type={inp_info['type']}, name={inp_info['name']}, id={inp_info['id']}, placeholder={inp_info['placeholder']}", file=sys.stderr)
+        print(f"페이지의 모든 버튼 ({len(info['buttons'])}개):", file=sys.stderr)
+        for btn_info in info['buttons']:
+            print(f"  Button {btn_info['index']}: text={btn_info['text']}, type={btn_info['type']}, class={btn_info['className']}", file=sys.stderr)
+    except Exception:
+        pass
+
+def submit_login(driver, email, password, profile, elements):
+    """로그인 폼 입력 후 로그인 완료까지 대기 (실패 시 예외)
+    
+    찾은 요소는 elements 에 채워, 실패했을 때 호출한 쪽에서 요소별 출처
+    (cache/discovery/heuristic)를 확인할 수 있게 합니다.
+    """
+    print("로그인 페이지로 이동 중...", file=sys.stderr)
+    driver.get(LOGIN_URL)
+    
+    # 페이지가 완전히 로드될 때까지 대기
+    print("페이지 로드 대기 중...", file=sys.stderr)
+    WebDriverWait(driver, 30).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+    
+    print(f"현재 URL: {driver.current_url}", file=sys.stderr)
+    print(f"페이지 제목: {driver.title}", file=sys.stderr)
+    
+    # 셀렉터 프로필(이전 실행에서 성공한 셀렉터)을 먼저 시도하고,
+    # 맞지 않는 요소만 전체 탐색 - 세 요소를 한 번의 스크립트 호출로 찾음
+    elements.update(resolve_login_elements(driver, profile))
+    
+    if not all(elements.get(key) for key in LOGIN_ELEMENT_SELECTORS):
+        print_login_debug_info(driver)
+    
+    for key, label in (("email", "이메일 입력 필드"), ("password", "비밀번호 입력 필드"), ("submit", "로그인 버튼")):
+        found = elements.get(key)
+        if found:
+            print(f"{label} 찾음 ({found['source']}): {found['selector']}", file=sys.stderr)
+    
+    if not elements.get("email"):
+        raise Exception("이메일 입력 필드를 찾을 수 없습니다. 페이지 구조를 확인해주세요.")
+    if not elements.get("password"):
+        raise Exception("비밀번호 입력 필드를 찾을 수 없습니다")
+    if not elements.get("submit"):
+        raise Exception("로그인 버튼을 찾을 수 없습니다")
+    
+    email_input = elements["email"]["element"]
+    password_input = elements["password"]["element"]
+    login_button = elements["submit"]["element"]
+    
+    # 이메일 입력
+    driver.execute_script("arguments[0].value = '';", email_input)
+    email_input.clear()
+    email_input.send_keys(email)
+    print("이메일 입력 완료", file=sys.stderr)
+    time.sleep(1)
+    
+    # 비밀번호 입력
+    driver.execute_script("arguments[0].value = '';", password_input)
+    password_input.clear()
+    password_input.send_keys(password)
+    print("비밀번호 입력 완료", file=sys.stderr)
+    time.sleep(1)
+    
+    # 로그인 버튼 클릭 (JavaScript로도 시도)
+    try:
+        driver.execute_script("arguments[0].click();", login_button)
+        print("로그인 버튼 클릭 (JavaScript)", file=sys.stderr)
+    except:
+        login_button.click()
+        print("로그인 버튼 클릭 (Python)", file=sys.stderr)
+    time.sleep(3)
+    
+    # 로그인 완료 대기 (URL 변경 확인)
+    print("로그인 완료 대기 중...", file=sys.stderr)
+    current_url = driver.current_url
+    print(f"현재 URL: {current_url}", file=sys.stderr)
+    
+    # URL이 변경되거나 특정 요소가 나타날 때까지 대기
+    WebDriverWait(driver, 20).until(
+        lambda d: d.current_url.rstrip("/") != LOGIN_URL.rstrip("/")
+    )
+    
+    time.sleep(2)
+    print(f"로그인 완료. 현재 URL: {driver.current_url}", file=sys.stderr)
+
+def print_login_error(e):
+    import traceback
+    error_trace = traceback.format_exc()
+    print(f"로그인 오류 상세: {error_trace}", file=sys.stderr)
+    print(json.dumps({
+        "success": False,
+        "error": f"로그인 실패: {str(e)}"
+    }), file=sys.stderr)
+
+def login(driver, email, password, profile_path=None):
+    """사이트에 자동 로그인"""
+    profile_path = profile_path or SELECTOR_PROFILE_PATH
+    profile = load_selector_profile(profile_path)
+    elements = {}
+    try:
+        submit_login(driver, email, password, profile, elements)
+    except Exception as e:
+        print_login_error(e)
+        stale = [key for key, found in elements.items() if found and found.get("source") == "cache"]
+        if not stale:
+            return False
         
-        # JavaScript로 로그인 버튼 찾기
-        login_button = None
+        # 사이트 개편 후 캐시된 셀렉터가 엉뚱한 요소에 맞을 수 있으므로
+        # 프로필을 지우고 캐시 없이(탐색만으로) 한 번 더 시도
+        print(f"캐시된 셀렉터({', '.join(stale)})로 로그인하지 못해 프로필을 지우고 다시 탐색합니다.", file=sys.stderr)
+        drop_selector_profile(profile_path)
+        profile = {}
+        elements = {}
         try:
-            login_button = driver.execute_script("""
-                // 여러 방법으로 로그인 버튼 찾기
-                var selectors = [
-                    'button[type="submit"]',
-                    'input[type="submit"]',
-                    'button:contains("로그인")',
-                    'button:contains("Login")',
-                    'button[class*="login" i]',
-                    'button[class*="submit" i]',
-                    'button.btn-primary',
-                    'button[class*="primary" i]'
-                ];
-                
-                // CSS 선택자로 찾기
-                for (var i = 0; i < selectors.length; i++) {
-                    try {
-                        var elem = document.querySelector(selectors[i]);
-                        if (elem && elem.offsetParent !== null) { // 화면에 보이는 요소만
-                            elem.scrollIntoView({behavior: 'smooth', block: 'center'});
-                            return elem;
-                        }
-                    } catch(e) {}
-                }
-                
-                // 모든 버튼 중에서 로그인 관련 텍스트가 있는 것 찾기
-                var buttons = document.querySelectorAll('button, input[type="submit"]');
-                for (var i = 0; i < buttons.length; i++) {
-                    var btn = buttons[i];
-                    var text = (btn.textContent || btn.value || '').toLowerCase();
-                    var className = (btn.className || '').toLowerCase();
-                    if (text.includes('로그인') || text.includes('login') || 
-                        className.includes('login') || className.includes('submit')) {
-                        if (btn.offsetParent !== null) { // 화면에 보이는 요소만
-                            btn.scrollIntoView({behavior: 'smooth', block: 'center'});
-                            return btn;
-                        }
-                    }
-                }
-                
-                // 마지막으로 type="submit"인 첫 번째 버튼
-                var submitBtn = document.querySelector('button[type="submit"], input[type="submit"]');
-                if (submitBtn) {
-                    submitBtn.scrollIntoView({behavior: 'smooth', block: 'center'});
-                    return submitBtn;
-                }
-                
-                return null;
-            """)
+            submit_login(driver, email, password, profile, elements)
         except Exception as e:
-            print(f"JavaScript로 로그인 버튼 찾기 오류: {str(e)}", file=sys.stderr)
-        
-        # Python으로도 찾기 시도
-        if not login_button:
-            button_selectors = [
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.XPATH, "//button[contains(text(), '로그인')]"),
-                (By.XPATH, "//button[contains(text(), 'Login')]"),
-                (By.XPATH, "//button[@type='submit']"),
-                (By.CSS_SELECTOR, "input[type='submit']"),
-                (By.CSS_SELECTOR, "button.btn-primary")
-            ]
-            
-            for selector_type, selector_value in button_selectors:
-                try:
-                    print(f"로그인 버튼 찾기 시도: {selector_type} = {selector_value}", file=sys.stderr)
-                    login_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((selector_type, selector_value))
-                    )
-                    print(f"로그인 버튼 찾음: {selector_type} = {selector_value}", file=sys.stderr)
-                    break
-                except:
-                    continue
-        
-        if not login_button:
-            # 모든 버튼 찾기 시도 (디버깅용)
-            try:
-                all_buttons = driver.find_elements(By.TAG_NAME, "button")
-                print(f"페이지의 모든 버튼 ({len(all_buttons)}개):", file=sys.stderr)
-                for i, btn in enumerate(all_buttons):
-                    try:
-                        print(f"  Button {i}: text={btn.text}, type={btn.get_attribute('type')}, class={btn.get_attribute('class')}", file=sys.stderr)
-                    except:
-                        pass
-            except:
-                pass
-            raise Exception("로그인 버튼을 찾을 수 없습니다")
-        
-        # 로그인 버튼 클릭 (JavaScript로도 시도)
-        try:
-            driver.execute_script("arguments[0].click();", login_button)
-            print("로그인 버튼 클릭 (JavaScript)", file=sys.stderr)
-        except:
-            login_button.click()
-            print("로그인 버튼 클릭 (Python)", file=sys.stderr)
-        time.sleep(3)
-        
-        # 로그인 완료 대기 (URL 변경 확인)
-        print("로그인 완료 대기 중...", file=sys.stderr)
-        current_url = driver.current_url
-        print(f"현재 URL: {current_url}", file=sys.stderr)
-        
-        # URL이 변경되거나 특정 요소가 나타날 때까지 대기
-        WebDriverWait(driver, 20).until(
-            lambda d: d.current_url != "https://ok-hrd-edu-ai1.lovable.app/" and d.current_url != "https://ok-hrd-edu-ai1.lovable.app"
-        )
-        
-        time.sleep(2)
-        print(f"로그인 완료. 현재 URL: {driver.current_url}", file=sys.stderr)
-        return True
-    except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"로그인 오류 상세: {error_trace}", file=sys.stderr)
-        print(json.dumps({
-            "success": False,
-            "error": f"로그인 실패: {str(e)}"
-        }), file=sys.stderr)
-        return False
+            print_login_error(e)
+            return False
+    
+    # 로그인에 성공한 셀렉터를 다음 실행을 위해 저장 (변경된 경우만)
+    resolved = {key: found["selector"] for key, found in elements.items() if found and found.get("selector")}
+    if resolved != profile:
+        save_selector_profile(resolved, profile_path)
+        print("로그인 셀렉터 프로필을 갱신했습니다.", file=sys.stderr)
+    return True
 
-def collect_cases(driver):
+def collect_cases(driver, linger=5):
     """게시글을 자동으로 수집"""
     selected_cases = []
     
@@ -426,33 +487,7 @@ def collect_cases(driver):
         print(f"JavaScript로 수집된 항목: {len(selected_items)}개", file=sys.stderr)
         
         # 수집된 항목 처리
-        for item in selected_items:
-            try:
-                url = item.get("url", driver.current_url) if isinstance(item, dict) else getattr(item, "url", driver.current_url)
-                title = item.get("title", "제목 없음") if isinstance(item, dict) else getattr(item, "title", "제목 없음")
-                content = item.get("content", "") if isinstance(item, dict) else getattr(item, "content", "")
-                
-                # 빈 제목과 내용은 건너뛰기
-                if not title or title == "제목 없음":
-                    if not content or len(content.strip()) < 10:
-                        continue
-                
-                external_id = url.split("/")[-1] if "/" in url else f"item_{int(time.time())}"
-                if not external_id or external_id == "" or external_id == "admin":
-                    external_id = f"item_{int(time.time())}_{len(selected_cases)}"
-                
-                selected_cases.append({
-                    "title": title[:200] if len(title) > 200 else title if title else "제목 없음",
-                    "content": content[:5000] if len(content) > 5000 else content,
-                    "source_url": url,
-                    "external_id": external_id,
-                    "published_at": datetime.now().isoformat()
-                })
-                
-                print(f"처리된 항목: {title[:50]}...", file=sys.stderr)
-            except Exception as e:
-                print(f"항목 처리 오류: {str(e)}", file=sys.stderr)
-                continue
+        selected_cases = process_collected_items(selected_items, driver.current_url)
         
         print(f"\n총 {len(selected_cases)}개의 게시글을 수집했습니다.", file=sys.stderr)
         
@@ -461,43 +496,44 @@ def collect_cases(driver):
         import traceback
         traceback.print_exc(file=sys.stderr)
     
-    # 브라우저를 5초간 열어둠 (사용자가 확인할 수 있도록)
-    print("\n브라우저가 5초간 열려있습니다. 페이지를 확인하세요...", file=sys.stderr)
-    time.sleep(5)
+    # 브라우저를 잠시 열어둠 (사용자가 확인할 수 있도록)
+    if linger:
+        print(f"\n브라우저가 {linger}초간 열려있습니다. 페이지를 확인하세요...", file=sys.stderr)
+        time.sleep(linger)
     
     return selected_cases
 
-def main():
-    email = "admin2026@okfg.com"
-    password = "admin2026"
-    
-    # Chrome 옵션 설정 (headless 모드 제거 - 브라우저 창 표시)
-    chrome_options = Options()
-    # headless 모드 제거
-    # chrome_options.add_argument("--headless")  # 주석 처리
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--start-maximized")  # 최대화된 창으로 시작
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+def collect_cases_with_login(driver, email, password, profile_path=None):
+    """로그인 후 게시글 수집 (브라우저 풀에서 실행하는 작업 단위)"""
+    if not login(driver, email, password, profile_path):
+        raise RuntimeError("로그인 실패")
+    return collect_cases(driver, linger=0)
+
+async def import_cases(pool, email, password, profile_path=None):
+    """BrowserPool 의 헤드리스 브라우저로 게시글 수집 (뉴스 크롤러와 풀 공유)"""
+    return await pool.run(collect_cases_with_login, email, password, profile_path)
+
+def run_cli(args):
+    """cli.py import-cases 서브커맨드"""
+    if not args.email or not args.password:
+        print(json.dumps({
+            "success": False,
+            "error": "로그인 정보가 없습니다. --email/--password 또는 AI_CASES_EMAIL/AI_CASES_PASSWORD 를 지정하세요."
+        }, ensure_ascii=False), file=sys.stderr)
+        return 1
     
     driver = None
     try:
         print("Chrome 브라우저를 시작합니다...", file=sys.stderr)
-        # Chrome 드라이버 초기화
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.implicitly_wait(5)
-        driver.set_page_load_timeout(30)
+        # Chrome 드라이버 초기화 (기본값은 브라우저 창 표시)
+        driver = create_driver(headless=args.headless)
         
         # 로그인
-        if not login(driver, email, password):
-            sys.exit(1)
+        if not login(driver, args.email, args.password, args.selector_profile):
+            return 1
         
         # 게시글 자동 수집
-        cases = collect_cases(driver)
+        cases = collect_cases(driver, linger=args.linger)
         
         if not cases:
             print(json.dumps({
@@ -513,6 +549,7 @@ def main():
                 "cases": cases,
                 "count": len(cases)
             }, ensure_ascii=False))
+        return 0
         
     except WebDriverException as e:
         error_msg = f"웹드라이버 오류: {str(e)}"
@@ -520,22 +557,23 @@ def main():
             "success": False,
             "error": error_msg
         }), file=sys.stderr)
-        sys.exit(1)
+        return 1
     except Exception as e:
         error_msg = f"예상치 못한 오류: {str(e)}"
         print(json.dumps({
             "success": False,
             "error": error_msg
         }), file=sys.stderr)
-        sys.exit(1)
+        return 1
     finally:
         if driver:
             # 브라우저를 3초간 더 열어둔 후 자동 종료
-            print("\n브라우저를 3초 후 자동으로 닫습니다...", file=sys.stderr)
-            try:
-                time.sleep(3)
-            except:
-                pass
+            if args.linger:
+                print("\n브라우저를 3초 후 자동으로 닫습니다...", file=sys.stderr)
+                try:
+                    time.sleep(3)
+                except:
+                    pass
             try:
                 driver.quit()
                 print("브라우저가 닫혔습니다.", file=sys.stderr)
@@ -543,4 +581,5 @@ def main():
                 pass
 
 if __name__ == "__main__":
-    main()
+    from cli import main
+    main(["import-cases", *sys.argv[1:]])
@@ -12,6 +12,17 @@ function parseSheet(file) {
   return JSON.parse(raw.substring(jsonStart));
 }
 
+// scripts/ingest_photos.py 가 만든 사번별 사진 manifest (없으면 photo_url 비움)
+function loadPhotoUrls(file) {
+  if (!fs.existsSync(file)) return {};
+  const photos = JSON.parse(fs.readFileSync(file, 'utf-8')).photos || {};
+  const urls = {};
+  for (const [employeeNumber, photo] of Object.entries(photos)) {
+    urls[employeeNumber] = photo.photo_url;
+  }
+  return urls;
+}
+
 async function main() {
   // 기존 데이터 삭제
   console.log('기존 데이터 삭제...');
@@ -57,8 +68,15 @@ async function main() {
 
   console.log(`1기: ${engineers1.length}명, 2기: ${engineers2.length}명`);
 
+  // 사진 URL 채우기
+  const photoUrls = loadPhotoUrls(process.env.ROSTER_PHOTO_MANIFEST || 'scripts/engineer_photos.json');
+  const all = [...engineers1, ...engineers2].map((eng) => ({
+    ...eng,
+    photo_url: (eng.employee_number && photoUrls[eng.employee_number]) || null,
+  }));
+  console.log(`사진 있는 인원: ${all.filter((eng) => eng.photo_url).length}명`);
+
   // 일괄 삽입
-  const all = [...engineers1, ...engineers2];
   const batchSize = 50;
 
   for (let i = 0; i < all.length; i += batchSize) {
@@ -1,58 +1,41 @@
 import csv
 import sys
 import os
+import json
+from sql_utils import escape_sql
 
-# CSV 파일 경로
-csv_file = r'c:\Users\user\Downloads\AI Engineer(1기) 명단 - 시트1.csv'
-
-# SQL 파일 생성
-sql_file = 'scripts/first_engineer_insert.sql'
-
-# CSV 파일 읽기
-with open(csv_file, 'r', encoding='utf-8') as f:
+def read_roster(f):
+    """명단 CSV 에서 헤더 2줄을 건너뛰고 컬럼 수가 충분한 행만 읽기"""
     reader = csv.reader(f)
-    
+
     # 헤더 2줄 건너뛰기
     next(reader)  # 첫 번째 헤더
     next(reader)  # 두 번째 헤더
-    
-    # SQL INSERT 문 생성
-    sql_statements = []
-    sql_statements.append("-- Insert data into first_engineer table\n")
-    sql_statements.append("BEGIN;\n\n")
-    
-    for row in reader:
-        if len(row) < 18:  # 최소 컬럼 수 확인
-            continue
-            
-        # 데이터 정리 및 이스케이프
-        def escape_sql(value):
-            if not value or value.strip() == '':
-                return 'NULL'
-            # SQL injection 방지를 위해 작은따옴표 이스케이프
-            escaped = value.replace("'", "''")
-            return f"'{escaped}'"
-        
-        no = row[0] if row[0] else 'NULL'
-        employee_id = escape_sql(row[1])
-        name = escape_sql(row[2])
-        gender = escape_sql(row[3])
-        company = escape_sql(row[4])
-        division1 = escape_sql(row[5])
-        division2 = escape_sql(row[6])
-        department2 = escape_sql(row[7])
-        final_department = escape_sql(row[8])
-        title = escape_sql(row[9])
-        position = escape_sql(row[10])
-        training_company = escape_sql(row[11])
-        training_department = escape_sql(row[12])
-        training_position = escape_sql(row[13])
-        overall_rank = row[14] if row[14] and row[14].strip() else 'NULL'
-        personal_rank = row[15] if row[15] and row[15].strip() else 'NULL'
-        evaluation_result = escape_sql(row[16])
-        tier = row[17] if row[17] and row[17].strip() else 'NULL'
-        
-        sql = f"""INSERT INTO first_engineer (
+
+    return [row for row in reader if len(row) >= 18]
+
+def row_to_sql(row):
+    """명단 CSV 한 줄을 first_engineer INSERT 문으로 변환"""
+    no = row[0] if row[0] else 'NULL'
+    employee_id = escape_sql(row[1])
+    name = escape_sql(row[2])
+    gender = escape_sql(row[3])
+    company = escape_sql(row[4])
+    division1 = escape_sql(row[5])
+    division2 = escape_sql(row[6])
+    department2 = escape_sql(row[7])
+    final_department = escape_sql(row[8])
+    title = escape_sql(row[9])
+    position = escape_sql(row[10])
+    training_company = escape_sql(row[11])
+    training_department = escape_sql(row[12])
+    training_position = escape_sql(row[13])
+    overall_rank = row[14] if row[14] and row[14].strip() else 'NULL'
+    personal_rank = row[15] if row[15] and row[15].strip() else 'NULL'
+    evaluation_result = escape_sql(row[16])
+    tier = row[17] if row[17] and row[17].strip() else 'NULL'
+
+    return f"""INSERT INTO first_engineer (
   no, employee_id, name, gender, company, division1, division2, department2,
   final_department, title, position, training_company, training_department,
   training_position, overall_rank, personal_rank, evaluation_result, tier
@@ -61,14 +44,67 @@ with open(csv_file, 'r', encoding='utf-8') as f:
   {final_department}, {title}, {position}, {training_company}, {training_department},
   {training_position}, {overall_rank}, {personal_rank}, {evaluation_result}, {tier}
 );\n"""
-        
-        sql_statements.append(sql)
-    
+
+def generate_sql(rows):
+    """헤더를 제외한 명단 행들로 SQL 문 목록 생성"""
+    sql_statements = []
+    sql_statements.append("-- Insert data into first_engineer table\n")
+    sql_statements.append("BEGIN;\n\n")
+
+    for row in rows:
+        if len(row) < 18:  # 최소 컬럼 수 확인
+            continue
+        sql_statements.append(row_to_sql(row))
+
     sql_statements.append("\nCOMMIT;\n")
-    
+    return sql_statements
+
+def generate_photo_sql(employee_ids, manifest_path):
+    """ingest-photos manifest 로 ai_engineers.photo_url UPDATE 문 생성"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        photos = json.load(f).get("photos", {})
+
+    sql_statements = []
+    for employee_id in employee_ids:
+        photo = photos.get(employee_id)
+        if photo:
+            sql_statements.append(
+                f"UPDATE ai_engineers SET photo_url = {escape_sql(photo['photo_url'])}, updated_at = now() "
+                f"WHERE employee_number = {escape_sql(employee_id)};\n"
+            )
+    return sql_statements
+
+def run_cli(args):
+    """cli.py import-roster 서브커맨드"""
+    if not args.csv:
+        print("명단 CSV 경로를 지정하세요: --csv 또는 ROSTER_CSV 환경 변수", file=sys.stderr)
+        return 1
+
+    # CSV 파일 읽기
+    with open(args.csv, 'r', encoding='utf-8') as f:
+        rows = read_roster(f)
+
+    # SQL INSERT 문 생성
+    sql_statements = generate_sql(rows)
+    insert_count = len(sql_statements) - 3
+
+    # 사진 manifest 가 있으면 photo_url 도 함께 갱신
+    photo_count = 0
+    if args.photo_manifest:
+        photo_sql = generate_photo_sql([row[1].strip() for row in rows if row[1].strip()], args.photo_manifest)
+        photo_count = len(photo_sql)
+        sql_statements[-1:-1] = ["\n", *photo_sql]
+
     # SQL 파일 저장
-    with open(sql_file, 'w', encoding='utf-8') as f:
+    with open(args.output, 'w', encoding='utf-8') as f:
         f.writelines(sql_statements)
-    
-    print(f"SQL 파일이 생성되었습니다: {sql_file}")
-    print(f"총 {len(sql_statements) - 3}개의 INSERT 문이 생성되었습니다.")
+
+    print(f"SQL 파일이 생성되었습니다: {args.output}")
+    print(f"총 {insert_count}개의 INSERT 문이 생성되었습니다.")
+    if args.photo_manifest:
+        print(f"총 {photo_count}개의 photo_url UPDATE 문이 생성되었습니다.")
+    return 0
+
+if __name__ == "__main__":
+    from cli import main
+    main(["import-roster", *sys.argv[1:]])
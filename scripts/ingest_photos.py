@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Engineer 명단 사진 처리 스크립트
+- 사번(employee_number)으로 이름 붙은 사진 폴더 (또는 --mapping CSV) 를 읽어
+- JPEG draft 모드로 필요한 크기까지만 디코딩하고
+- 얼굴(피부색 영역) 중심의 정사각형 썸네일을 정해진 크기별로 생성 (프로세스 풀)
+- 명단 임포터가 photo_url 을 채울 수 있도록 manifest JSON 작성
+
+    python scripts/cli.py ingest-photos --input photos/
+"""
+import os
+import re
+import sys
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, ImageOps
+    import numpy as np
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install Pillow numpy")
+    exit(1)
+
+PHOTO_EXTENSIONS = (".jpg", ".jpeg", ".png")
+JPEG_QUALITY = 85
+# 사번은 출력 파일명과 URL 에 그대로 쓰이므로 경로 구분자나 .. 가 없는 단순 토큰만 허용
+EMPLOYEE_NUMBER_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+def load_mapping(path):
+    """employee_number,filename 형식의 CSV 를 {파일명: 사번} 으로 읽기"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return {row["filename"].strip(): row["employee_number"].strip() for row in csv.DictReader(f) if row.get("filename")}
+
+def find_photos(input_dir, mapping=None):
+    """(사번, 사진 경로) 목록
+
+    같은 사번의 사진이 여러 장이면(E001.jpg 와 E001.jpeg, 같은 사번을 가리키는
+    --mapping 행 등) 같은 출력 파일을 동시에 쓰지 않도록 파일명 순으로 첫 번째만 사용합니다.
+    """
+    photos = []
+    sources = {}
+    for name in sorted(os.listdir(input_dir)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in PHOTO_EXTENSIONS:
+            continue
+        employee_number = mapping.get(name) if mapping is not None else stem.strip()
+        if not employee_number:
+            continue
+        if not EMPLOYEE_NUMBER_PATTERN.fullmatch(employee_number):
+            print(f"사번 형식이 잘못되어 건너뜁니다: {name} -> {employee_number!r}", file=sys.stderr)
+            continue
+        if employee_number in sources:
+            print(f"같은 사번의 사진이 여러 장이라 건너뜁니다: {name} -> {employee_number} ({sources[employee_number]} 사용)", file=sys.stderr)
+            continue
+        sources[employee_number] = name
+        photos.append((employee_number, os.path.join(input_dir, name)))
+    return photos
+
+def face_center(img):
+    """피부색 픽셀(YCbCr)의 무게중심으로 얼굴 위치 추정 (0~1 비율 좌표)
+
+    얼굴 검출 모델 없이 Pillow/NumPy 만 사용하므로, 피부색 영역이 너무 적으면
+    증명사진 구도를 가정해 가로 중앙, 세로 1/3 지점을 반환합니다.
+    """
+    small = img.copy()
+    small.thumbnail((128, 128))
+    ycbcr = np.asarray(small.convert("YCbCr"), dtype=np.int16)
+    cb, cr = ycbcr[:, :, 1], ycbcr[:, :, 2]
+    skin = (cb >= 77) & (cb <= 127) & (cr >= 133) & (cr <= 173)
+
+    # 상체/손 대신 얼굴을 잡도록 위쪽 60% 영역만 사용
+    skin[int(skin.shape[0] * 0.6):, :] = False
+    if skin.sum() < skin.size * 0.01:
+        return 0.5, 1 / 3
+
+    ys, xs = np.nonzero(skin)
+    return (xs.mean() + 0.5) / skin.shape[1], (ys.mean() + 0.5) / skin.shape[0]
+
+def square_crop_box(width, height, center):
+    """짧은 변 길이의 정사각형을 center 에 맞추되 이미지 밖으로 나가지 않게 배치"""
+    side = min(width, height)
+    cx, cy = center[0] * width, center[1] * height
+    left = int(min(max(cx - side / 2, 0), width - side))
+    top = int(min(max(cy - side / 2, 0), height - side))
+    return left, top, left + side, top + side
+
+def process_photo(task):
+    """사진 하나를 크기별 정사각형 JPEG 로 저장 (프로세스 풀에서 실행)"""
+    employee_number, source, output_dir, sizes = task
+    with Image.open(source) as img:
+        # JPEG 는 DCT 단계에서 1/2, 1/4, 1/8 로 축소 디코딩 (가장 큰 썸네일 이상 크기 유지)
+        img.draft("RGB", (max(sizes), max(sizes)))
+        img = ImageOps.exif_transpose(img).convert("RGB")
+
+    crop = img.crop(square_crop_box(img.width, img.height, face_center(img)))
+
+    variants = {}
+    for size in sorted(sizes, reverse=True):
+        # 큰 크기부터 만들어 다음 크기의 입력으로 재사용
+        crop = crop.resize((size, size), Image.LANCZOS, reducing_gap=3.0)
+        filename = f"{employee_number}_{size}.jpg"
+        crop.save(os.path.join(output_dir, filename), "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        variants[str(size)] = filename
+    return employee_number, variants
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"sizes": [], "photos": {}}
+
+def run_cli(args):
+    """cli.py ingest-photos 서브커맨드"""
+    if not args.input:
+        print("사진 폴더를 지정하세요: --input 또는 ROSTER_PHOTOS_DIR 환경 변수", file=sys.stderr)
+        return 1
+
+    sizes = sorted(set(args.sizes))
+    os.makedirs(args.output, exist_ok=True)
+    mapping = load_mapping(args.mapping) if args.mapping else None
+    manifest = load_manifest(args.manifest)
+    if manifest.get("sizes") != sizes:
+        manifest = {"sizes": sizes, "photos": {}}
+    url_prefix = args.url_prefix.rstrip("/")
+
+    # 원본이 바뀌지 않은 사진은 건너뛰기
+    tasks = []
+    for employee_number, source in find_photos(args.input, mapping):
+        stat = os.stat(source)
+        entry = manifest["photos"].get(employee_number)
+        if not args.force and entry and entry.get("source") == os.path.basename(source) \
+                and entry.get("source_mtime") == stat.st_mtime and entry.get("source_size") == stat.st_size:
+            continue
+        tasks.append((employee_number, source, args.output, sizes))
+
+    print(f"처리할 사진 {len(tasks)}장 (프로세스 {args.workers or os.cpu_count()}개)", file=sys.stderr)
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers or None) as executor:
+        futures = [(task, executor.submit(process_photo, task)) for task in tasks]
+        for (employee_number, source, _, _), future in futures:
+            try:
+                _, variants = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"사진 처리 오류 ({source}): {str(e)}", file=sys.stderr)
+                continue
+            stat = os.stat(source)
+            manifest["photos"][employee_number] = {
+                "source": os.path.basename(source),
+                "source_mtime": stat.st_mtime,
+                "source_size": stat.st_size,
+                "photo_url": f"{url_prefix}/{variants[str(max(sizes))]}",
+                "variants": {size: f"{url_prefix}/{name}" for size, name in variants.items()},
+            }
+
+    with open(args.manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    print(f"manifest 가 저장되었습니다: {args.manifest} (총 {len(manifest['photos'])}명, 실패 {failed}장)")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    from cli import main
+    main(["ingest-photos", *sys.argv[1:]])
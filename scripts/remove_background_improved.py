@@ -10,12 +10,8 @@ except ImportError:
     print("pip install Pillow numpy")
     exit(1)
 
-def remove_background_improved(input_path, output_path):
-    """배경을 더 정확하게 투명하게 만들기"""
-    # 이미지 열기
-    img = Image.open(input_path).convert("RGBA")
-    data = np.array(img)
-    
+def clear_background(data):
+    """RGBA 배열에서 배경 픽셀의 알파를 0으로 설정 (data 를 직접 수정)"""
     # RGB 채널 추출
     r, g, b, a = data[:, :, 0], data[:, :, 1], data[:, :, 2], data[:, :, 3]
     
@@ -43,6 +39,13 @@ def remove_background_improved(input_path, output_path):
     
     # 알파 채널 업데이트 (배경을 투명하게)
     data[:, :, 3] = np.where(background_mask, 0, a)
+    return data
+
+def remove_background_improved(input_path, output_path):
+    """배경을 더 정확하게 투명하게 만들기"""
+    # 이미지 열기
+    img = Image.open(input_path).convert("RGBA")
+    data = clear_background(np.array(img))
     
     # 결과 이미지 저장
     result = Image.fromarray(data)
@@ -51,15 +54,6 @@ def remove_background_improved(input_path, output_path):
     return True
 
 if __name__ == "__main__":
-    input_file = "public/okman3.png"
-    output_file = "public/okman3_transparent.png"
-    
-    try:
-        if remove_background_improved(input_file, output_file):
-            print("성공! okman3_transparent.png 파일이 업데이트되었습니다.")
-    except FileNotFoundError:
-        print(f"파일을 찾을 수 없습니다: {input_file}")
-    except Exception as e:
-        print(f"오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+    import sys
+    from cli import main
+    main(["images", "remove-background-improved", *sys.argv[1:]])
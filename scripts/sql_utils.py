@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQL 파일을 생성하는 스크립트들이 함께 쓰는 도우미
+"""
+
+# 데이터 정리 및 이스케이프
+def escape_sql(value):
+    if not value or value.strip() == '':
+        return 'NULL'
+    # SQL injection 방지를 위해 작은따옴표 이스케이프
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
@@ -0,0 +1,20 @@
+-- 사용자별 포인트 집계 테이블 (scripts/aggregate_points.py 가 upsert)
+CREATE TABLE IF NOT EXISTS user_point_summary (
+  user_id uuid REFERENCES profiles(id) ON DELETE CASCADE PRIMARY KEY,
+  total_points integer NOT NULL DEFAULT 0,
+  activity_count integer NOT NULL DEFAULT 0,
+  points_by_type jsonb NOT NULL DEFAULT '{}'::jsonb,
+  counts_by_type jsonb NOT NULL DEFAULT '{}'::jsonb,
+  eligible_badges text[] NOT NULL DEFAULT '{}',
+  last_activity_at timestamp with time zone,
+  updated_at timestamp with time zone DEFAULT now()
+);
+
+-- RLS 활성화
+ALTER TABLE user_point_summary ENABLE ROW LEVEL SECURITY;
+
+-- user_point_summary 정책 (쓰기는 service role 배치만)
+CREATE POLICY "Anyone can read user point summary" ON user_point_summary FOR SELECT USING (true);
+
+-- 인덱스 (리더보드 정렬)
+CREATE INDEX IF NOT EXISTS idx_user_point_summary_total_points ON user_point_summary(total_points DESC);